@@ -1,6 +1,89 @@
+from functools import lru_cache
+
+import numpy as np
 import pandas as pd
 
 
+# Explicit read schemas so pandas skips type inference
+_AIRCRAFT_DB_DTYPES = {
+    "name": str,
+    "mtom": "float64",
+    "mlm": "float64",
+    "num_main_tyres": "int32",
+    "main_gear_tyre_code": str,
+    "nose_gear_tyre_code": str,
+}
+
+_TYRE_DB_DTYPES = {
+    "tyre_code": str,
+    "ply_rating": "float64",
+    "speed_rating_mph": "float64",
+    "rated_load_lbs": str,  # thousands separators, e.g. "2,900"
+    "inflation_pressure_psi": "float64",
+    "tire_mass_lbs": "float64",
+    "nitrogen_mass_lbs": "float64",
+    "do_max_in": "float64",
+    "ds_max_in": "float64",
+    "w_max_in": "float64",
+    "ws_max_in": "float64",
+    "aspect_ratio": "float64",
+    "static_radius_min_in": "float64",
+    "static_radius_max_in": "float64",
+    "wheel_size": str,
+    "rim_width_in": "float64",
+    "rim_diameter_in": "float64",
+    "flange_height_in": "float64",
+    "min_ledge_width_in": "float64",
+}
+
+# Landing velocity cases; MTOM applies to the 1.83 m/s case, MLM to the others
+_V_CASES = np.array([1.83, 3.05, 3.7])
+_USES_MTOM = np.array([True, False, False])
+
+# Number of tyres on the nose landing gear
+_NOSE_GEAR_N_TYRES = 2
+
+
+@lru_cache(maxsize=None)
+def _load_aircraft_db(path):
+    """
+    Read the aircraft database CSV once per path.
+    """
+    return pd.read_csv(path, dtype=_AIRCRAFT_DB_DTYPES, usecols=list(_AIRCRAFT_DB_DTYPES))
+
+
+@lru_cache(maxsize=None)
+def _load_tyre_db(path):
+    """
+    Read the tyre database CSV once per path.
+
+    Adds a "rated_load_N" column so callers do not parse "rated_load_lbs" themselves.
+    """
+    tyre_df = pd.read_csv(path, dtype=_TYRE_DB_DTYPES)
+    tyre_df["rated_load_N"] = tyre_df["rated_load_lbs"].str.replace(",", "", regex=False).astype(float) * 4.44822
+    return tyre_df
+
+
+def _index_by(df, key):
+    """
+    Index a database DataFrame by its identifier column for O(1) lookups.
+
+    Duplicate identifiers keep their first row, matching a first-match scan.
+    """
+    df = df.drop_duplicates(subset=key, keep="first")
+    return df.set_index(key, drop=False).to_dict(orient="index")
+
+
+@lru_cache(maxsize=None)
+def _aircraft_index(path):
+    return _index_by(_load_aircraft_db(path), "name")
+
+
+@lru_cache(maxsize=None)
+def _tyre_index(path):
+    return _index_by(_load_tyre_db(path), "tyre_code")
+
+
 def get_aircraft_data(aircraft_name, aircraft_csv):
     """
     Retrieve mass properties and tyre codes for a specific aircraft.
@@ -12,13 +95,10 @@ def get_aircraft_data(aircraft_name, aircraft_csv):
     Returns:
     - dict: Aircraft mass properties and tyre codes
     """
-    aircraft_df = pd.read_csv(aircraft_csv)
-    aircraft_row = aircraft_df[aircraft_df["name"] == aircraft_name]
-
-    if aircraft_row.empty:
-        raise ValueError(f"Aircraft '{aircraft_name}' not found in database.")
-
-    aircraft = aircraft_row.iloc[0]
+    try:
+        aircraft = _aircraft_index(aircraft_csv)[aircraft_name]
+    except KeyError:
+        raise ValueError(f"Aircraft '{aircraft_name}' not found in database.") from None
 
     return {
         "name": aircraft["name"],
@@ -41,13 +121,10 @@ def get_tyre_data(tyre_code, tyre_csv):
     Returns:
     - dict: Tyre specifications
     """
-    tyre_df = pd.read_csv(tyre_csv)
-    tyre_row = tyre_df[tyre_df["tyre_code"] == tyre_code]
-
-    if tyre_row.empty:
-        raise ValueError(f"Tyre code '{tyre_code}' not found in database.")
-
-    return tyre_row.iloc[0].to_dict()
+    try:
+        return dict(_tyre_index(tyre_csv)[tyre_code])
+    except KeyError:
+        raise ValueError(f"Tyre code '{tyre_code}' not found in database.") from None
 
 def lambda_xt_iter(
     V, x_a, m, r_max_in, r_min_in, load_rating, n_tyres,
@@ -67,27 +144,51 @@ def lambda_xt_iter(
     return lambda_val, x_t
 
 
+def lambda_xt_closed_form(
+    V, x_a, m, r_max_in, r_min_in, load_rating, n_tyres,
+    eta_a=0.80, eta_t=0.47, g=9.81
+):
+    """
+    Solve the lambda/x_t fixed point of lambda_xt_iter analytically.
+
+    Substituting lambda into the tyre stroke equation gives the quadratic
+    2*L*n*eta_t*x_t**2 + 2*L*n*eta_a*x_a*x_t - 0.9*V**2*m*(r_max - r_min) = 0,
+    whose positive root is returned. Accepts scalars or NumPy arrays.
+    """
+    r_max = r_max_in * 0.0254
+    r_min = r_min_in * 0.0254
+    a = 2 * eta_t * load_rating * n_tyres
+    b = 2 * eta_a * x_a * load_rating * n_tyres
+    q = 0.9 * V**2 * m * (r_max - r_min)
+    # Positive root in cancellation-free form
+    x_t = 2 * q / (b + np.sqrt(b**2 + 4 * a * q))
+    lambda_val = V**2 / (2 * g * (eta_a * x_a + eta_t * x_t))
+    return lambda_val, x_t
+
+
 # Wrapper function
 def solve_reaction_factor(tyre_code, mtom, mlm, n_tyres, x_a, tyre_csv):
     tyre = get_tyre_data(tyre_code, tyre_csv)
     r_max_in = float(tyre['do_max_in']) / 2
     r_min_in = float(tyre['static_radius_max_in'])
-    rated_load_lbs = float(str(tyre['rated_load_lbs']).replace(",", ""))
-    load_rating = rated_load_lbs * 4.44822
-
-    results = []
-    for V in [1.83, 3.05, 3.7]:
-        m = mtom if V == 1.83 else mlm
-        λ, x_t = lambda_xt_iter(V, x_a, m, r_max_in, r_min_in, load_rating, n_tyres)
-        results.append({
+    load_rating = tyre['rated_load_N']
+
+    # All three velocity/mass cases in a single vector pass
+    V = _V_CASES
+    m = np.where(_USES_MTOM, mtom, mlm).astype(float)
+    λ, x_t = lambda_xt_closed_form(V, x_a, m, r_max_in, r_min_in, load_rating, n_tyres)
+
+    return [
+        {
             "tyre_code": tyre_code,
-            "V [m/s]": V,
-            "mass [kg]": m,
-            "lambda": λ,
+            "V [m/s]": V[i],
+            "mass [kg]": m[i],
+            "lambda": λ[i],
             "x_a [m]": x_a,
-            "x_t [m]": x_t
-        })
-    return results
+            "x_t [m]": x_t[i]
+        }
+        for i in range(V.size)
+    ]
 
 def compute_reaction_factors_for_aircraft(
     aircraft_name,
@@ -118,9 +219,90 @@ def compute_reaction_factors_for_aircraft(
         tyre_code=aircraft["nose_gear_tyre_code"],
         mtom=mtom_nose,
         mlm=mlm_nose,
-        n_tyres=2,
+        n_tyres=_NOSE_GEAR_N_TYRES,
         x_a=x_a_nose,
         tyre_csv=tyre_csv
     )
 
     return pd.DataFrame(main_results + nose_results)
+
+def compute_reaction_factors_for_fleet(
+    aircraft_names,
+    x_a_main,
+    x_a_nose,
+    aircraft_csv,
+    tyre_csv,
+    nose_gear_mass_fraction=0.15
+):
+    """
+    Reaction factors and tyre strokes for several aircraft in one vectorised pass.
+
+    Equivalent to calling compute_reaction_factors_for_aircraft per aircraft,
+    with "aircraft" and "gear" columns identifying each row.
+
+    Returns:
+    - DataFrame: One row per aircraft x {main, nose} x 3 velocity cases
+    """
+    aircraft_df = _load_aircraft_db(aircraft_csv).drop_duplicates(subset="name").set_index("name")
+    missing = [name for name in aircraft_names if name not in aircraft_df.index]
+    if missing:
+        raise ValueError(f"Aircraft {missing} not found in database.")
+    aircraft_df = aircraft_df.loc[list(aircraft_names)].reset_index()
+
+    # One row per aircraft and gear
+    main_df = pd.DataFrame({
+        "aircraft": aircraft_df["name"],
+        "gear": "main",
+        "tyre_code": aircraft_df["main_gear_tyre_code"],
+        "mtom": aircraft_df["mtom"],
+        "mlm": aircraft_df["mlm"],
+        "n_tyres": aircraft_df["num_main_tyres"],
+        "x_a [m]": x_a_main,
+    })
+    nose_df = pd.DataFrame({
+        "aircraft": aircraft_df["name"],
+        "gear": "nose",
+        "tyre_code": aircraft_df["nose_gear_tyre_code"],
+        "mtom": nose_gear_mass_fraction * aircraft_df["mtom"],
+        "mlm": nose_gear_mass_fraction * aircraft_df["mlm"],
+        "n_tyres": _NOSE_GEAR_N_TYRES,
+        "x_a [m]": x_a_nose,
+    })
+    tyre_df = _load_tyre_db(tyre_csv).drop_duplicates(subset="tyre_code")
+    # Interleave main and nose rows per aircraft; both frames share the aircraft index
+    gear_df = pd.concat([main_df, nose_df]).sort_index(kind="stable").reset_index(drop=True)
+    gear_df = gear_df.merge(
+        tyre_df[["tyre_code", "do_max_in", "static_radius_max_in", "rated_load_N"]],
+        on="tyre_code", how="left", indicator=True
+    )
+    not_found = gear_df["_merge"] == "left_only"
+    if not_found.any():
+        missing = gear_df.loc[not_found, "tyre_code"].unique().tolist()
+        raise ValueError(f"Tyre code {missing} not found in database.")
+
+    # Expand to the velocity cases
+    n_gears = len(gear_df)
+    gear_df = gear_df.loc[gear_df.index.repeat(_V_CASES.size)].reset_index(drop=True)
+    V = np.tile(_V_CASES, n_gears)
+    m = np.where(np.tile(_USES_MTOM, n_gears), gear_df["mtom"], gear_df["mlm"]).astype(float)
+
+    λ, x_t = lambda_xt_closed_form(
+        V,
+        gear_df["x_a [m]"].to_numpy(dtype=float),
+        m,
+        gear_df["do_max_in"].to_numpy(dtype=float) / 2,
+        gear_df["static_radius_max_in"].to_numpy(dtype=float),
+        gear_df["rated_load_N"].to_numpy(dtype=float),
+        gear_df["n_tyres"].to_numpy(dtype=float)
+    )
+
+    return pd.DataFrame({
+        "aircraft": gear_df["aircraft"],
+        "gear": gear_df["gear"],
+        "tyre_code": gear_df["tyre_code"],
+        "V [m/s]": V,
+        "mass [kg]": m,
+        "lambda": λ,
+        "x_a [m]": gear_df["x_a [m]"],
+        "x_t [m]": x_t
+    })
@@ -1,41 +1,33 @@
 import pandas as pd
 import numpy as np
-import math
 import matplotlib.pyplot as plt
+from functools import lru_cache
+from numba import njit, prange
 
-def get_tyre_data(tyre_code, tyre_csv):
-    """
-    Retrieve tyre properties for a specific tyre code.
+from functions_SA_analysis import _V_CASES, _USES_MTOM
 
-    Parameters:
-    - tyre_code (str): Tyre model/code (e.g., "H49x19.0-22")
-    - tyre_csv (str): Path to tyre database CSV
 
-    Returns:
-    - dict: Tyre specifications
+@lru_cache(maxsize=None)
+def _load_seal_diameters(path):
     """
-    tyre_df = pd.read_csv(tyre_csv)
-    tyre_row = tyre_df[tyre_df["tyre_code"] == tyre_code]
-
-    if tyre_row.empty:
-        raise ValueError(f"Tyre code '{tyre_code}' not found in database.")
+    Sorted AS4716 gland "C" diameters (inches) for first-larger-seal lookups.
+    """
+    seal_df = pd.read_csv(path, usecols=["C"], dtype={"C": "float64"})
+    return np.sort(seal_df["C"].to_numpy())
 
-    return tyre_row.iloc[0].to_dict()
+def _tyre_constants(tyre_data):
+    """
+    Reduce a tyre record to (r_max_m, r_min_m, load_rating_N) once per tyre.
+    """
+    r_max_m = float(tyre_data["do_max_in"]) / 2 * 0.0254
+    r_min_m = float(tyre_data["static_radius_max_in"]) * 0.0254
+    load_rating_N = float(tyre_data["rated_load_N"])
+    return r_max_m, r_min_m, load_rating_N
 
 def compute_full_stroke_from_reaction_factor(
-    mass, lambda_val, V, tyre_data, n_tyres,
+    r_max, r_min, load_rating, mass, lambda_val, V, n_tyres,
     eta_a=0.80, eta_t=0.47, g=9.81
 ):
-    # Tyre parameters
-    r_max_in = float(tyre_data["do_max_in"]) / 2
-    r_min_in = float(tyre_data["static_radius_max_in"])
-    rated_load_lbs = float(str(tyre_data["rated_load_lbs"]).replace(",", ""))
-    load_rating = rated_load_lbs * 4.44822
-
-    # Radii in metres
-    r_max = r_max_in * 0.0254
-    r_min = r_min_in * 0.0254
-
     # Tyre stroke
     x_t = (0.9 * lambda_val * g * mass * (r_max - r_min)) / (load_rating * n_tyres)
 
@@ -54,51 +46,63 @@ def compute_stroke_breakdown_from_lambdas(
     mlg_tyre_data, nlg_tyre_data,
     n_mlg_tyres, n_nlg_tyres
 ):
-    results = []
-
-    for V, total_mass in zip([1.83, 3.05, 3.7], [mtom, mlm, mlm]):
-        mlg_mass = total_mass * (1 - nlg_mass_fraction)
-        nlg_mass = total_mass * nlg_mass_fraction
+    # All three velocity/mass cases as length-3 arrays
+    V = _V_CASES
+    total_mass = np.where(_USES_MTOM, mtom, mlm).astype(float)
+    mlg_mass = total_mass * (1 - nlg_mass_fraction)
+    nlg_mass = total_mass * nlg_mass_fraction
+
+    # Main gear
+    x_t_mlg, x_a_mlg, x_total_mlg = compute_full_stroke_from_reaction_factor(
+        *_tyre_constants(mlg_tyre_data), mlg_mass, mlg_lambda, V, n_mlg_tyres
+    )
+
+    # Nose gear
+    x_t_nlg, x_a_nlg, x_total_nlg = compute_full_stroke_from_reaction_factor(
+        *_tyre_constants(nlg_tyre_data), nlg_mass, nlg_lambda, V, n_nlg_tyres
+    )
+
+    return pd.DataFrame({
+        "V [m/s]": V,
+        "Mass [kg]": total_mass,
+        "MLG x_t [m]": x_t_mlg,
+        "MLG x_a [m]": x_a_mlg,
+        "MLG x_total [m]": x_total_mlg,
+        "NLG x_t [m]": x_t_nlg,
+        "NLG x_a [m]": x_a_nlg,
+        "NLG x_total [m]": x_total_nlg,
+    })
+
+def _piston_diameter(ramp_mass_kg, load_fraction, static_pressure, num_gear_legs, gravity=9.81):
+    """
+    Piston diameter (m) carrying the static ramp load per gear leg; scalars or arrays.
+    """
+    force_per_gear_ramp = ramp_mass_kg * gravity * load_fraction / num_gear_legs
+    A_piston = force_per_gear_ramp / static_pressure
+    return (4 * A_piston / np.pi) ** 0.5
 
-        # Main gear
-        x_t_mlg, x_a_mlg, x_total_mlg = compute_full_stroke_from_reaction_factor(
-            mlg_mass, mlg_lambda, V, mlg_tyre_data, n_mlg_tyres
-        )
+def _select_seal_diameter(d_piston, seal_csv="data/AS4716_seal_db.csv"):
+    """
+    Diameter (m) of the first AS4716 seal larger than d_piston; scalars or arrays.
+    """
+    seal_C_in = _load_seal_diameters(seal_csv)
 
-        # Nose gear
-        x_t_nlg, x_a_nlg, x_total_nlg = compute_full_stroke_from_reaction_factor(
-            nlg_mass, nlg_lambda, V, nlg_tyre_data, n_nlg_tyres
-        )
+    # Convert piston diameter to inches
+    d_piston_in = np.asarray(d_piston) * 39.3701
 
-        results.append({
-            "V [m/s]": V,
-            "Mass [kg]": total_mass,
-            "MLG x_t [m]": x_t_mlg,
-            "MLG x_a [m]": x_a_mlg,
-            "MLG x_total [m]": x_total_mlg,
-            "NLG x_t [m]": x_t_nlg,
-            "NLG x_a [m]": x_a_nlg,
-            "NLG x_total [m]": x_total_nlg,
-        })
+    # Find first seal where B dimension is larger than d_piston
+    idx = np.searchsorted(seal_C_in, d_piston_in, side="right")
+    if np.any(idx == seal_C_in.size):
+        raise ValueError(f"No seal in database fits a {np.max(d_piston_in):.3f} in piston.")
 
-    return pd.DataFrame(results)
+    selected_B_in = seal_C_in[idx]
+    return selected_B_in / 39.3701  # convert back to meters
 
-def oleo_pneumatic_sizing(
-    ramp_mass_kg,
-    landing_mass_kg,
-    load_fraction,
-    reaction_factor,
-    shock_absorber_travel_m,
-    breakout_load_fraction,
-    static_pressure,
-    num_gear_legs,
-    max_load_factor,
-    limit_stroke_m,
-    gravity=9.81
+def _oleo_core(
+    ramp_mass_kg, landing_mass_kg, load_fraction, reaction_factor,
+    shock_absorber_travel_m, breakout_load_fraction, num_gear_legs,
+    max_load_factor, d_corrected, gravity
 ):
-    """
-    Compute main oleo-pneumatic shock absorber sizing values based on aircraft mass and configuration.
-    """
     # Forces supported per main landing gear
     ramp_force_total = ramp_mass_kg * gravity * load_fraction
     landing_force_total = landing_mass_kg * gravity * load_fraction
@@ -109,24 +113,6 @@ def oleo_pneumatic_sizing(
     # Breakout load based on landing static load
     breakout_load = breakout_load_fraction * force_per_gear_landing
 
-    # Calculate piston area
-    A_piston = force_per_gear_ramp / static_pressure
-    d_piston = (4 * A_piston / math.pi) ** 0.5
-
-    # Load the seal database
-    seal_db = pd.read_csv("data/AS4716_seal_db.csv")
-
-    # Convert piston diameter to inches
-    d_piston_in = d_piston * 39.3701
-
-    # Find first seal where B dimension is larger than d_piston
-    matching_seal = seal_db[seal_db["C"] > d_piston_in].iloc[0]
-
-    # Extract relevant data
-    selected_B_in = matching_seal["C"]
-    selected_B = selected_B_in / 39.3701  # convert back to meters
-    d_corrected = selected_B
-
     # Calculate corrected static pressure
     A_piston_corrected = (np.pi * d_corrected ** 2) / 4
     P_static_corrected = force_per_gear_ramp / A_piston_corrected
@@ -148,49 +134,130 @@ def oleo_pneumatic_sizing(
     V_1 = V_0 * P_0 / P_1
     x_static = (V_0 - V_1) / A_piston_corrected
 
-    # Generate spring curve (isothermal)
-    n_points = 100
-    x = np.linspace(0, shock_absorber_travel_m, n_points)
-    V = V_0 - A_piston_corrected * x
-    P = P_0 * V_0 / V
-
-    print('Compression ratio: %.2f' % (V_0 / V_2))
-
-    # Plot
-    plt.figure(figsize=(9, 6))
-    plt.plot(x * 1000, P / 1e6)
-    plt.axvline(x=x_static * 1000, color='red', linestyle='--')
-    plt.text(x_static * 1000 + 10, (P_1 / 1e6) / 2, f"Static Pos.\n{x_static * 1000:.1f} mm", color='red')
-
-    # Add maximum load lines
-    plt.axhline(y=P_max_ground_handling / 1e6, color='blue', linestyle='--')
-    plt.text(5, (P_max_ground_handling / 1e6) + 0.2, "Max GH Load", color='blue')
-
-    plt.axhline(y=P_max_landing / 1e6, color='green', linestyle='--')
-    plt.text(5, (P_max_landing / 1e6) + 0.2, "Max Landing Load", color='green')
-
-    # Add limit landing stroke
-    plt.axvline(x=limit_stroke_m * 1000, color='purple', linestyle='--')
-    plt.text(limit_stroke_m * 1000 + 10, 18, "Limit Stroke", color='purple', rotation=90, verticalalignment='center')
-
-    plt.xlabel("Shock Absorber Compression (mm)")
-    plt.ylabel("Gas Pressure (MPa)")
-    plt.title("Oleo-Pneumatic Spring Curve (Isothermal)")
-    plt.grid(True)
-
-    # Add information box
-    textstr = '\n'.join((
-        f'Breakout Pressure: {P_0 / 1e6:.2f} MPa',
-        f'Static Pressure: {P_1 / 1e6:.2f} MPa',
-        f'Max Pressure: {P_2 / 1e6:.2f} MPa',
-        f'Compression Ratio: {V_0 / V_2:.2f}',
-        f'Piston Diameter: {d_corrected*1000:.1f} mm'
-    ))
-
-    props = dict(boxstyle='round', facecolor='wheat', alpha=0.5)
-    plt.gca().text(0.05, 0.95, textstr, transform=plt.gca().transAxes, fontsize=10,
-                   verticalalignment='top', horizontalalignment='left', bbox=props)
-
-    plt.tight_layout()
-    plt.show()
-    return P_0, P_1, P_2, x_static, d_corrected
\ No newline at end of file
+    return (P_0, P_1, P_2, x_static, V_0, V_2,
+            P_max_ground_handling, P_max_landing, A_piston_corrected)
+
+_oleo_core_jit = njit(cache=True)(_oleo_core)
+
+@njit(parallel=True, cache=True)
+def _oleo_sweep_kernel(params, d_corrected, gravity):
+    N = params.shape[0]
+    out = np.empty((N, 5))
+    for i in prange(N):
+        p = params[i]
+        P_0, P_1, P_2, x_static, _, _, _, _, _ = _oleo_core_jit(
+            p[0], p[1], p[2], p[3], p[4], p[5], p[7], p[8], d_corrected[i], gravity
+        )
+        out[i, 0] = P_0
+        out[i, 1] = P_1
+        out[i, 2] = P_2
+        out[i, 3] = x_static
+        out[i, 4] = d_corrected[i]
+    return out
+
+def oleo_pneumatic_sizing_sweep(params, gravity=9.81):
+    """
+    Oleo-pneumatic sizing for many design points in parallel, without plotting.
+
+    Parameters:
+    - params (array, shape (N, 9)): One design point per row, columns
+      ramp_mass_kg, landing_mass_kg, load_fraction, reaction_factor,
+      shock_absorber_travel_m, breakout_load_fraction, static_pressure,
+      num_gear_legs, max_load_factor
+    - gravity (float): Gravitational acceleration
+
+    Returns:
+    - array, shape (N, 5): P_0, P_1, P_2, x_static, d_corrected per row, as
+      returned by oleo_pneumatic_sizing
+    """
+    params = np.ascontiguousarray(params, dtype=np.float64)
+    # The Numba kernel does no bounds checking, so validate the layout here
+    if params.ndim != 2 or params.shape[1] != 9:
+        raise ValueError(f"params must have shape (N, 9), got {params.shape}.")
+    d_piston = _piston_diameter(params[:, 0], params[:, 2], params[:, 6], params[:, 7], gravity)
+    d_corrected = _select_seal_diameter(d_piston)
+    return _oleo_sweep_kernel(params, d_corrected, float(gravity))
+
+def oleo_pneumatic_sizing(
+    ramp_mass_kg,
+    landing_mass_kg,
+    load_fraction,
+    reaction_factor,
+    shock_absorber_travel_m,
+    breakout_load_fraction,
+    static_pressure,
+    num_gear_legs,
+    max_load_factor,
+    limit_stroke_m,
+    gravity=9.81,
+    plot=True,
+    ax=None
+):
+    """
+    Compute main oleo-pneumatic shock absorber sizing values based on aircraft mass and configuration.
+
+    The compression ratio is printed and the spring curve drawn only when plot is
+    True, into ax if given or a new figure otherwise; showing the figure is left
+    to the caller.
+    """
+    # Piston diameter from static pressure, corrected to the next seal size
+    d_piston = _piston_diameter(ramp_mass_kg, load_fraction, static_pressure, num_gear_legs, gravity)
+    d_corrected = _select_seal_diameter(d_piston)
+
+    (P_0, P_1, P_2, x_static, V_0, V_2,
+     P_max_ground_handling, P_max_landing, A_piston_corrected) = _oleo_core(
+        ramp_mass_kg, landing_mass_kg, load_fraction, reaction_factor,
+        shock_absorber_travel_m, breakout_load_fraction, num_gear_legs,
+        max_load_factor, d_corrected, gravity
+    )
+
+    if plot:
+        print('Compression ratio: %.2f' % (V_0 / V_2))
+
+        own_figure = ax is None
+        if own_figure:
+            _, ax = plt.subplots(figsize=(9, 6))
+
+        # Generate spring curve (isothermal), P = P_0 * V_0 / (V_0 - A * x)
+        n_points = 100
+        x = np.linspace(0, shock_absorber_travel_m, n_points)
+        P = P_0 / (1 - (A_piston_corrected / V_0) * x)
+
+        # Plot
+        ax.plot(x * 1000, P / 1e6)
+        ax.axvline(x=x_static * 1000, color='red', linestyle='--')
+        ax.text(x_static * 1000 + 10, (P_1 / 1e6) / 2, f"Static Pos.\n{x_static * 1000:.1f} mm", color='red')
+
+        # Add maximum load lines
+        ax.axhline(y=P_max_ground_handling / 1e6, color='blue', linestyle='--')
+        ax.text(5, (P_max_ground_handling / 1e6) + 0.2, "Max GH Load", color='blue')
+
+        ax.axhline(y=P_max_landing / 1e6, color='green', linestyle='--')
+        ax.text(5, (P_max_landing / 1e6) + 0.2, "Max Landing Load", color='green')
+
+        # Add limit landing stroke
+        ax.axvline(x=limit_stroke_m * 1000, color='purple', linestyle='--')
+        ax.text(limit_stroke_m * 1000 + 10, 18, "Limit Stroke", color='purple', rotation=90, verticalalignment='center')
+
+        ax.set_xlabel("Shock Absorber Compression (mm)")
+        ax.set_ylabel("Gas Pressure (MPa)")
+        ax.set_title("Oleo-Pneumatic Spring Curve (Isothermal)")
+        ax.grid(True)
+
+        # Add information box
+        textstr = '\n'.join((
+            f'Breakout Pressure: {P_0 / 1e6:.2f} MPa',
+            f'Static Pressure: {P_1 / 1e6:.2f} MPa',
+            f'Max Pressure: {P_2 / 1e6:.2f} MPa',
+            f'Compression Ratio: {V_0 / V_2:.2f}',
+            f'Piston Diameter: {d_corrected*1000:.1f} mm'
+        ))
+
+        props = dict(boxstyle='round', facecolor='wheat', alpha=0.5)
+        ax.text(0.05, 0.95, textstr, transform=ax.transAxes, fontsize=10,
+                verticalalignment='top', horizontalalignment='left', bbox=props)
+
+        if own_figure:
+            ax.figure.tight_layout()
+
+    return P_0, P_1, P_2, x_static, d_corrected
@@ -1,5 +1,7 @@
 import pandas as pd
-from functions_SA_sizing import get_tyre_data, compute_stroke_breakdown_from_lambdas, oleo_pneumatic_sizing
+import matplotlib.pyplot as plt
+from functions_SA_analysis import get_tyre_data
+from functions_SA_sizing import compute_stroke_breakdown_from_lambdas, oleo_pneumatic_sizing
 
 # Sizing properties
 MTOM = 76000
@@ -59,3 +61,5 @@ _, _, _, _, d_corrected = oleo_pneumatic_sizing(
 )
 
 print('NLG piston diameter: %.2f'%d_corrected)
+
+plt.show()
@@ -1,5 +1,29 @@
+import math
 import numpy as np
 import matplotlib.pyplot as plt
+from numba import njit
+
+
+@njit(cache=True, fastmath=True)
+def follow(x_cp, y_cp, CMG_m, x_m0, y_m0):
+    """
+    Trail the main gear behind the cockpit gear at a rigid distance CMG_m.
+    """
+    N = x_cp.size
+    x_m = np.empty(N)
+    y_m = np.empty(N)
+    heading_m = np.empty(N)
+    xm = x_m0
+    ym = y_m0
+    for i in range(N):
+        h = math.atan2(y_cp[i] - ym, x_cp[i] - xm)
+        xm = x_cp[i] - CMG_m * math.cos(h)
+        ym = y_cp[i] - CMG_m * math.sin(h)
+        x_m[i] = xm
+        y_m[i] = ym
+        heading_m[i] = h
+    return x_m, y_m, heading_m
+
 
 # Inputs
 turn_radius_m = 45.0         # Desired cockpit/cockpit gear turn radius (m)
@@ -24,102 +48,33 @@ t_straight_after = 30   # extended seconds after turn
 t_total = t_straight_before + t_turn + t_straight_after
 time = np.arange(0, t_total + dt, dt)
 
-# Initialize lists
-x_cockpit = []
-y_cockpit = []
-psi_cockpit = []
-
-x_main = []
-y_main = []
-heading_main = []
+# Steering schedule (turning right during the turn phase)
+steering_rate = np.where(
+    (time > t_straight_before) & (time <= t_straight_before + t_turn),
+    -omega_radps, 0.0
+)
 
-x_main_left = []
-y_main_left = []
-x_main_right = []
-y_main_right = []
+# Cockpit gear heading and position (cockpit facing north, starting at origin)
+psi_cockpit = np.pi/2 + np.cumsum(steering_rate) * dt
+x_cockpit = np.cumsum(speed_mps * dt * np.cos(psi_cockpit))
+y_cockpit = np.cumsum(speed_mps * dt * np.sin(psi_cockpit))
 
-x_nose = []
-y_nose = []
+# Main gear starts CMG_m behind cockpit gear
+x_m0 = -CMG_m * np.cos(np.pi/2)
+y_m0 = -CMG_m * np.sin(np.pi/2)
 
-# Start positions
-x_cp = 0.0
-y_cp = 0.0
-heading_cp = np.pi/2  # cockpit facing north
+# --- Real main gear (following real track) ---
+x_main, y_main, heading_main = follow(x_cockpit, y_cockpit, CMG_m, x_m0, y_m0)
 
-# Main gear starts CMG_m behind cockpit gear
-x_m = x_cp - CMG_m * np.cos(heading_cp)
-y_m = y_cp - CMG_m * np.sin(heading_cp)
+x_nose = x_cockpit - (CMG_m-wheelbase_m) * np.cos(heading_main)
+y_nose = y_cockpit - (CMG_m-wheelbase_m) * np.sin(heading_main)
 
-# Main gear starts CMG_m behind cockpit gear
-x_n = x_cp - (CMG_m-wheelbase_m) * np.cos(heading_cp)
-y_n = y_cp - (CMG_m-wheelbase_m) * np.sin(heading_cp)
-
-# Simulation loop
-for t in time:
-    # Determine steering
-    if t <= t_straight_before:
-        steering_rate = 0.0
-    elif t_straight_before < t <= t_straight_before + t_turn:
-        steering_rate = -omega_radps  # turning right
-    else:
-        steering_rate = 0.0
-
-    # Update cockpit gear heading
-    heading_cp += steering_rate * dt
-
-    # Update cockpit gear position
-    x_cp += speed_mps * dt * np.cos(heading_cp)
-    y_cp += speed_mps * dt * np.sin(heading_cp)
-
-    # Store cockpit gear data
-    x_cockpit.append(x_cp)
-    y_cockpit.append(y_cp)
-    psi_cockpit.append(heading_cp)
-
-    # --- Real main gear (following real track) ---
-    delta_x = x_cp - x_m
-    delta_y = y_cp - y_m
-    heading_m = np.arctan2(delta_y, delta_x)
-    heading_main.append(heading_m)
-
-    # Update real main gear position by projection (rigid wheelbase)
-    x_m = x_cp - CMG_m * np.cos(heading_m)
-    y_m = y_cp - CMG_m * np.sin(heading_m)
-
-    x_n = x_cp - (CMG_m-wheelbase_m) * np.cos(heading_m)
-    y_n = y_cp - (CMG_m-wheelbase_m) * np.sin(heading_m)
-
-    x_main.append(x_m)
-    y_main.append(y_m)
-
-    x_nose.append(x_n)
-    y_nose.append(y_n)
-
-    # Calculate left and right main gear wheels
-    half_track = main_gear_track_m / 2
-    x_ml = x_m - half_track * np.sin(heading_m)
-    y_ml = y_m + half_track * np.cos(heading_m)
-    x_mr = x_m + half_track * np.sin(heading_m)
-    y_mr = y_m - half_track * np.cos(heading_m)
-
-    x_main_left.append(x_ml)
-    y_main_left.append(y_ml)
-    x_main_right.append(x_mr)
-    y_main_right.append(y_mr)
-
-# Convert to arrays
-x_cockpit = np.array(x_cockpit)
-y_cockpit = np.array(y_cockpit)
-psi_cockpit = np.array(psi_cockpit)
-x_main = np.array(x_main)
-y_main = np.array(y_main)
-heading_main = np.array(heading_main)
-x_main_left = np.array(x_main_left)
-y_main_left = np.array(y_main_left)
-x_main_right = np.array(x_main_right)
-y_main_right = np.array(y_main_right)
-x_nose = np.array(x_nose)
-y_nose = np.array(y_nose)
+# Calculate left and right main gear wheels
+half_track = main_gear_track_m / 2
+x_main_left = x_main - half_track * np.sin(heading_main)
+y_main_left = y_main + half_track * np.cos(heading_main)
+x_main_right = x_main + half_track * np.sin(heading_main)
+y_main_right = y_main - half_track * np.cos(heading_main)
 
 # --- Simulate Ideal Main Gear Centre Path (Independent Simulation) ---
 
@@ -130,52 +85,37 @@ lag_time = lag_distance / speed_mps  # time lag (seconds)
 t_straight_before_ideal = t_straight_before + lag_time
 t_straight_after_ideal = t_total - (t_straight_before_ideal + t_turn)
 
-# Rebuild ideal path
-x_main_ideal = []
-y_main_ideal = []
-heading_ideal = []
-
-# Start position for ideal main gear
-x_m_ideal = x_main[0]
-y_m_ideal = y_main[0]
-heading_ideal_current = np.pi/2  # facing north
-
-for t_now in time:
-    if t_now <= t_straight_before_ideal:
-        steering_rate = 0.0
-    elif t_straight_before_ideal < t_now <= t_straight_before_ideal + t_turn:
-        steering_rate = -omega_radps
-    else:
-        steering_rate = 0.0
-
-    heading_ideal_current += steering_rate * dt
-    x_m_ideal += speed_mps * dt * np.cos(heading_ideal_current)
-    y_m_ideal += speed_mps * dt * np.sin(heading_ideal_current)
-
-    x_main_ideal.append(x_m_ideal)
-    y_main_ideal.append(y_m_ideal)
-    heading_ideal.append(heading_ideal_current)
-
-# Convert to arrays
-x_main_ideal = np.array(x_main_ideal)
-y_main_ideal = np.array(y_main_ideal)
+# Rebuild ideal path, starting at the real main gear start position facing north
+steering_rate_ideal = np.where(
+    (time > t_straight_before_ideal) & (time <= t_straight_before_ideal + t_turn),
+    -omega_radps, 0.0
+)
+heading_ideal = np.pi/2 + np.cumsum(steering_rate_ideal) * dt
+x_main_ideal = x_main[0] + np.cumsum(speed_mps * dt * np.cos(heading_ideal))
+y_main_ideal = y_main[0] + np.cumsum(speed_mps * dt * np.sin(heading_ideal))
 
 # --- Taxiway edges based on cockpit gear path ---
 offset = taxiway_width_m / 2
-x_left = x_cockpit - offset * np.sin(psi_cockpit)
-y_left = y_cockpit + offset * np.cos(psi_cockpit)
-x_right = x_cockpit + offset * np.sin(psi_cockpit)
-y_right = y_cockpit - offset * np.cos(psi_cockpit)
-
-# Extend taxiway downward manually
-x_left = np.insert(x_left, 0, x_left[0])
-y_left = np.insert(y_left, 0, y_left[0] - 40)
-x_right = np.insert(x_right, 0, x_right[0])
-y_right = np.insert(y_right, 0, y_right[0] - 40)
+N = time.size
+sin_psi = np.sin(psi_cockpit)
+cos_psi = np.cos(psi_cockpit)
+
+# Edge points as (x, y) rows; row 0 extends the taxiway downward manually
+left = np.empty((N + 1, 2))
+right = np.empty((N + 1, 2))
+left[1:, 0] = x_cockpit - offset * sin_psi
+left[1:, 1] = y_cockpit + offset * cos_psi
+right[1:, 0] = x_cockpit + offset * sin_psi
+right[1:, 1] = y_cockpit - offset * cos_psi
+left[0] = (left[1, 0], left[1, 1] - 40)
+right[0] = (right[1, 0], right[1, 1] - 40)
+
+x_left, y_left = left[:, 0], left[:, 1]
+x_right, y_right = right[:, 0], right[:, 1]
 
 # Create taxiway polygon
-x_polygon = np.concatenate([x_left, x_right[::-1]])
-y_polygon = np.concatenate([y_left, y_right[::-1]])
+polygon = np.concatenate([left, right[::-1]])
+x_polygon, y_polygon = polygon[:, 0], polygon[:, 1]
 
 # --- Plotting ---
 plt.figure(figsize=(12,12))
@@ -193,21 +133,20 @@ plt.plot(x_main_right, y_main_right, 'r:', label='MLG outer tyre path')
 
 
 # Plot T-shapes every 10 seconds
-for idx, t_now in enumerate(time):
-    if np.isclose(t_now % 10, 0, atol=dt/2):
-        x_cp_current = x_cockpit[idx]
-        y_cp_current = y_cockpit[idx]
-        x_m_current = x_main[idx]
-        y_m_current = y_main[idx]
-        psi_m_current = heading_main[idx]
-
-        x_m_left = x_m_current - half_track * np.sin(psi_m_current)
-        y_m_left = y_m_current + half_track * np.cos(psi_m_current)
-        x_m_right = x_m_current + half_track * np.sin(psi_m_current)
-        y_m_right = y_m_current - half_track * np.cos(psi_m_current)
-
-        plt.plot([x_cp_current, x_m_current], [y_cp_current, y_m_current], color='black', linewidth=0.8)
-        plt.plot([x_m_left, x_m_right], [y_m_left, y_m_right], color='black', linewidth=0.8)
+mark_idx = np.rint(np.arange(0, t_total, 10) / dt).astype(int)
+
+x_cp_marks = x_cockpit[mark_idx]
+y_cp_marks = y_cockpit[mark_idx]
+x_m_marks = x_main[mark_idx]
+y_m_marks = y_main[mark_idx]
+x_m_left_marks = x_main_left[mark_idx]
+y_m_left_marks = y_main_left[mark_idx]
+x_m_right_marks = x_main_right[mark_idx]
+y_m_right_marks = y_main_right[mark_idx]
+
+for i in range(mark_idx.size):
+    plt.plot([x_cp_marks[i], x_m_marks[i]], [y_cp_marks[i], y_m_marks[i]], color='black', linewidth=0.8)
+    plt.plot([x_m_left_marks[i], x_m_right_marks[i]], [y_m_left_marks[i], y_m_right_marks[i]], color='black', linewidth=0.8)
 
 # Final plot settings
 plt.gca().set_aspect('equal')
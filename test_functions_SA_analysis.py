@@ -0,0 +1,34 @@
+import os
+
+import pandas as pd
+import pytest
+
+from functions_SA_analysis import (
+    compute_reaction_factors_for_aircraft,
+    compute_reaction_factors_for_fleet,
+)
+
+AIRCRAFT_CSV = "data/aircraft_db.csv"
+TYRE_CSV = "data/tyre_db.csv"
+
+
+@pytest.fixture(autouse=True)
+def repo_root(monkeypatch):
+    # The databases are read from paths relative to the repository root
+    monkeypatch.chdir(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_fleet_matches_per_aircraft_results():
+    names = ["777", "A320", "707", "A320"]
+
+    fleet = compute_reaction_factors_for_fleet(names, 0.540, 0.405, AIRCRAFT_CSV, TYRE_CSV)
+    expected = pd.concat(
+        [compute_reaction_factors_for_aircraft(name, 0.540, 0.405, AIRCRAFT_CSV, TYRE_CSV) for name in names],
+        ignore_index=True
+    )
+
+    assert fleet["aircraft"].tolist() == [name for name in names for _ in range(6)]
+    assert fleet["gear"].tolist() == (["main"] * 3 + ["nose"] * 3) * len(names)
+    pd.testing.assert_frame_equal(
+        fleet.drop(columns=["aircraft", "gear"]), expected, check_dtype=False
+    )
@@ -0,0 +1,48 @@
+import os
+
+import numpy as np
+import pytest
+
+from functions_SA_sizing import oleo_pneumatic_sizing, oleo_pneumatic_sizing_sweep
+
+# MLG and NLG design points from main_SA_sizing.py, in sweep column order:
+# ramp_mass_kg, landing_mass_kg, load_fraction, reaction_factor,
+# shock_absorber_travel_m, breakout_load_fraction, static_pressure,
+# num_gear_legs, max_load_factor
+PARAMS = np.array([
+    [76000, 76000, 0.95, 1.1, 0.6, 0.17, 13.0E6, 2, 1.7],
+    [76000, 76000, 0.15, 1.1, 0.5, 0.15, 13.0E6, 1, 2.2],
+])
+
+
+@pytest.fixture(autouse=True)
+def repo_root(monkeypatch):
+    # The seal database is read from a path relative to the repository root
+    monkeypatch.chdir(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_sizing_matches_reference_values():
+    # Reference values from the original main_SA_sizing.py run
+    P_0, P_1, P_2, x_static, d_corrected = oleo_pneumatic_sizing(*PARAMS[0], limit_stroke_m=0.5, plot=False)
+    assert d_corrected == pytest.approx(0.18974, abs=1e-5)
+    assert P_1 == pytest.approx(12.525e6, rel=1e-4)
+    assert x_static == pytest.approx(0.55333, abs=1e-5)
+
+    out = oleo_pneumatic_sizing_sweep(PARAMS)
+    # Isothermal compression ratio V_0 / V_2 equals P_2 / P_0
+    np.testing.assert_allclose(out[:, 2] / out[:, 0], [10.00, 14.67], atol=5e-3)
+    np.testing.assert_allclose(out[0], [P_0, P_1, P_2, x_static, d_corrected], rtol=1e-12)
+
+
+def test_sweep_matches_scalar_sizing():
+    out = oleo_pneumatic_sizing_sweep(PARAMS)
+
+    for row, result in zip(PARAMS, out):
+        expected = oleo_pneumatic_sizing(*row, limit_stroke_m=0.5, plot=False)
+        np.testing.assert_allclose(result, expected, rtol=1e-12)
+
+
+@pytest.mark.parametrize("params", [PARAMS[:, :8], PARAMS[0], PARAMS[None]])
+def test_sweep_rejects_wrong_shape(params):
+    with pytest.raises(ValueError, match=r"shape \(N, 9\)"):
+        oleo_pneumatic_sizing_sweep(params)